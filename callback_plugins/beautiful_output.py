@@ -16,13 +16,18 @@ in your project, and set the `stdout_callback` option on `ansible.cfg`
     stdout_callback = beautiful_output
 
 """
+import functools
+import itertools
 import json
 import os
 import re
+import shutil
 import textwrap
-from collections import OrderedDict
+from collections import ChainMap
+from collections import Counter
 from collections.abc import Sequence
 from enum import Enum
+from enum import IntEnum
 from enum import auto
 from typing import TYPE_CHECKING
 from typing import Callable
@@ -36,8 +41,6 @@ from ansible.module_utils.common._collections_compat import Mapping
 from ansible.plugins.callback import CallbackBase
 from ansible.template import Templar
 from ansible.utils.color import stringc
-from ansible.vars.clean import module_response_deepcopy
-from ansible.vars.clean import strip_internal_keys
 
 if TYPE_CHECKING:
     from ansible.executor.task_result import TaskResult
@@ -45,6 +48,23 @@ if TYPE_CHECKING:
     from ansible.playbook.play import Play
     from ansible.playbook.task import Task
 
+try:
+    import re2 as ansi_re
+except ImportError:
+    ansi_re = re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper
+    from yaml import SafeLoader as YamlSafeLoader
+
 DOCUMENTATION = """---
     callback: beautiful_output
     type: stdout
@@ -61,8 +81,10 @@ DOCUMENTATION = """---
       - set as stdout in configuration
 """
 
-TERMINAL_WIDTH = os.get_terminal_size().columns
+# Falls back to $COLUMNS or 80 columns when stdout is not a terminal (e.g. CI)
+TERMINAL_WIDTH = shutil.get_terminal_size((80, 24)).columns
 DIVIDER = "─"
+DIVIDER_LINE = DIVIDER * TERMINAL_WIDTH
 
 """
 A dictionary of symbols to be used when the Callback
@@ -100,37 +122,53 @@ _session_title: dict[str, str] = {
 }
 
 
-"""A dictionary representing the order in
-which sections should be displayed to user.
+"""A tuple of (key, verbosity) pairs representing the
+order in which sections should be displayed to user.
 """
-_session_order = OrderedDict(
-    [
-        ("_ansible_no_log", 3),
-        ("use_stderr", 4),
-        ("msg", 1),
-        ("stdout", 1),
-        ("module_stdout", 1),
-        ("stderr", 1),
-        ("module_stderr", 0),
-        ("rc", 3),
-        ("changed", 3),
-    ]
+_session_order: tuple[tuple[str, int], ...] = (
+    ("_ansible_no_log", 3),
+    ("use_stderr", 4),
+    ("msg", 1),
+    ("stdout", 1),
+    ("module_stdout", 1),
+    ("stderr", 1),
+    ("module_stderr", 0),
+    ("rc", 3),
+    ("changed", 3),
 )
 
 
+"""A translation table turning result keys into words."""
+_title_translation = str.maketrans({"_": " ", ".": " "})
+
+
+"""Characters a JSON document can start with."""
+JSON_START_CHARS = frozenset('{["-0123456789tfn \t\r\n')
+
+"""A run of digits long enough to hold an integer outside the 64-bit range,
+which `orjson` would silently parse as a float.
+"""
+LONG_DIGIT_RUN = re.compile(r"[0-9]{19}")
+
+"""Prefixes of session text worth re-dumping as YAML."""
+STRUCTURED_TEXT_PREFIXES = ("{", "---")
+
+
+"""An empty result used when verbosity is checked without a TaskResult.
+It must never be modified.
+"""
+_empty_result: dict = {}
+
+
 """A regular expression that can match any
-ANSI escape sequence in a string.
+ANSI escape sequence in a string: ESC, a 7-bit C1 Fe byte, parameter bytes,
+intermediate bytes and a final byte. Besides the colors `stringc` emits, this
+covers the cursor and erase sequences found in raw module output.
+
+It is compiled with `re2` when available, so the scan runs in linear time
+without backtracking, and falls back to the standard `re` module otherwise.
 """
-ansi_escape = re.compile(
-    r"""
-    \x1B    # ESC
-    [@-_]   # 7-bit C1 Fe
-    [0-?]*  # Parameter bytes
-    [ -/]*  # Intermediate bytes
-    [@-~]   # Final byte
-""",
-    re.VERBOSE,
-)
+ansi_escape = ansi_re.compile(r"\x1b[@-_][0-?]*[ -/]*[@-~]")
 
 
 """Enum for possible statuses of a TaskResult."""
@@ -144,6 +182,15 @@ class TaskStatus(Enum):
     CHANGED = auto()
 
 
+"""Enum for the possible display decisions of a Task title."""
+
+
+class TaskDisplayDecision(IntEnum):
+    SKIP = 0
+    UNKNOWN = 1
+    SHOW = 2
+
+
 def symbol(key: str, color: Optional[str] = None) -> str:
     """Helper function that returns an U)nicode character based on the given
     `key`. This function also colorize the returned string using the
@@ -157,6 +204,19 @@ def symbol(key: str, color: Optional[str] = None) -> str:
     return stringc(output, color)
 
 
+"""Symbols used by the runner callbacks, resolved (and colored) only once."""
+SYMBOL_SUCCESS = symbol("success")
+SYMBOL_FAILURE = symbol("failure")
+SYMBOL_SKIP = symbol("skip")
+SYMBOL_RETRY = symbol("retry")
+SYMBOL_DEAD = symbol("dead")
+SYMBOL_PLAYBOOK = symbol("playbook")
+SYMBOL_ARROW_RIGHT = symbol("arrow_right")
+SYMBOL_EMPTY = symbol("empty")
+NO_HOSTS_MATCHED = f"  {symbol('warning', 'bright yellow')} No hosts found!"
+NO_HOSTS_REMAINING = f"  {symbol('warning', 'bright red')} Ran out of hosts!"
+
+
 def iscollection(obj: object) -> bool:
     """Helper method to check if a given object is not only a Sequence, but also
     **not** any kind of string.
@@ -164,6 +224,43 @@ def iscollection(obj: object) -> bool:
     return isinstance(obj, Sequence) and not isinstance(obj, str)
 
 
+@functools.lru_cache(maxsize=128)
+def prettify_title(title: str) -> str:
+    """Converts a result key (e.g. `ansible_facts.os_family`) into a
+    capitalized section title. Result keys repeat across tasks, so the
+    titles are cached.
+    """
+    return title.translate(_title_translation).capitalize()
+
+
+def json_loads(text: str) -> object:
+    """Parses the JSON document in `text`.
+
+    Uses `orjson` when it is installed, falling back to the standard `json`
+    module for documents that may hold integers wider than 64 bits, which only
+    the standard module keeps exact, or when it is not available.
+    """
+    if orjson and not LONG_DIGIT_RUN.search(text):
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def compact_json(obj: object) -> str:
+    """Serializes `obj` to JSON without any whitespace between tokens.
+
+    Uses `orjson` when it is installed, falling back to the standard `json`
+    module for objects `orjson` refuses (e.g. dictionaries with non-string
+    keys) or when it is not available.
+    """
+    if orjson:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
 def stringtruncate(
     value: str,
     color: Optional[str] = "normal",
@@ -191,52 +288,26 @@ def stringtruncate(
     if not value:
         return fillchar * width
 
-    if not justfn:
-        justfn = str.rjust if isinstance(value, int) else str.ljust
-
     if isinstance(value, int):
+        justfn = justfn or str.rjust
         value = to_text("{:n}").format(value)
+    else:
+        justfn = justfn or str.ljust
+        value = str(value)
 
-    truncsize = len(truncate_placeholder)
-    do_not_trucate = len(value) <= width or width == 0
-    truncated_width = width - truncsize
-
-    return stringc(
-        to_text(justfn(str(value), width))
-        if do_not_trucate
-        else to_text(
-            "{0}{1}".format(
-                value[:truncated_width]
-                if justfn == str.ljust
-                else truncate_placeholder,
-                truncate_placeholder
-                if justfn == str.ljust
-                else value[truncated_width:],
-            )
-        ),
-        color,
-    )
-
-
-def dictsum(totals: dict[object, int], values: dict[object, int]):
-    """Given two dictionaries of `int` values, this method will sum the
-    value in `totals` with values in `values`.
+    if not width:
+        return stringc(value, color)
+    if len(value) <= width:
+        return stringc(justfn(value, width, fillchar), color)
 
-    If a key in `values` does not exist in `totals`, that key will be
-    added to it, and its initial value will be the same as in `values`.
-
-    Note:
-        The type of the keys in the dictionaries are irrelevant
-
-    Args:
-        totals: The total cached from previous calls of this functions.
-        values: The dictionary of values used to sum up the totals.
-    """
-    for key, value in values.items():
-        if key not in totals:
-            totals[key] = value
-        else:
-            totals[key] += value
+    # The placeholder plus the kept part of `value` is exactly `width` long
+    truncated_width = width - len(truncate_placeholder)
+    if truncated_width <= 0:
+        # No room for any of `value`, not even for the whole placeholder
+        return stringc(truncate_placeholder[:width], color)
+    if justfn == str.ljust:
+        return stringc(value[:truncated_width] + truncate_placeholder, color)
+    return stringc(truncate_placeholder + value[-truncated_width:], color)
 
 
 class CallbackModule(CallbackBase):
@@ -255,15 +326,21 @@ class CallbackModule(CallbackBase):
     CALLBACK_TYPE = "stdout"
     CALLBACK_NAME = "beautiful_output"
 
+    _SUMMARY_ROW_FORMAT = " {0} {1} {2} {3} {4} {5} {6}"
+
     def __init__(self, display=None):
         CallbackBase.__init__(self, display)
         self.delegated_vars: dict
         self._item_processed: bool
         self._current_play: "Play" = None
         self._current_host: str
-        self._task_name_buffer: str
+        self._task_name_buffer: Optional[str] = None
         self.task_display_name: str
         self.should_display: bool = False
+        self.my_role: str = ""
+        self._role_prefix_cache: dict[str, str] = {}
+        self._log_enabled: bool = bool(C.DEFAULT_LOG_PATH)
+        self._tags_cache: dict[tuple[int, tuple[str, ...]], list[str]] = {}
 
     def display(
         self,
@@ -279,7 +356,8 @@ class CallbackModule(CallbackBase):
 
         Any `msg` that is displayed with this method, will be displayed
         without any changes on the screen, and will have all the ANSI escape
-        sequences stripped before displaying it on the logs.
+        sequences stripped before displaying it on the logs. When no log file is
+        configured, the log copy is skipped altogether.
         """
         self._display.display(
             msg=msg,
@@ -288,8 +366,13 @@ class CallbackModule(CallbackBase):
             screen_only=True,
             newline=newline,
         )
+        if not self._log_enabled:
+            return
+
+        # Most messages carry no escape sequence at all, so skip the regex scan
+        log_msg = ansi_escape.sub("", msg) if "\x1b" in msg else msg
         self._display.display(
-            msg=ansi_escape.sub("", msg),
+            msg=log_msg,
             stderr=stderr,
             log_only=True,
         )
@@ -307,7 +390,7 @@ class CallbackModule(CallbackBase):
         ):
             playbook_name = f"{playbook_name} (check mode)"
 
-        self.display(to_text(f"{symbol('playbook')} Playbook: {playbook_name}"))
+        self.display(to_text(f"{SYMBOL_PLAYBOOK} Playbook: {playbook_name}"))
 
         # show CLI arguments
         if self._is_run_verbose(verbosity=3) or C.DISPLAY_ARGS_TO_STDOUT:
@@ -317,19 +400,13 @@ class CallbackModule(CallbackBase):
 
     def v2_playbook_on_no_hosts_matched(self):
         """Display a warning when there is no hosts available."""
-        self.display(
-            "  %s No hosts found!" % symbol("warning", "bright yellow"),
-            color=C.COLOR_DEBUG,
-        )
+        self.display(NO_HOSTS_MATCHED, color=C.COLOR_DEBUG)
 
     def v2_playbook_on_no_hosts_remaining(self):
         """Display an error when any hosts that were alive when it
         started running are not reachable anymore.
         """
-        self.display(
-            "  %s Ran out of hosts!" % symbol("warning", "bright red"),
-            color=C.COLOR_ERROR,
-        )
+        self.display(NO_HOSTS_REMAINING, color=C.COLOR_ERROR)
 
     def v2_playbook_on_play_start(self, play: "Play"):
         """Displays a banner with the play name and the hosts used in this
@@ -346,11 +423,8 @@ class CallbackModule(CallbackBase):
             return
 
         if play.hosts:
-            self.display("💻 Hosts: ", newline=False)
-            my_hosts = []
-            for host in play.hosts:
-                my_hosts.append(stringc(host, C.COLOR_HIGHLIGHT))
-            self.display(", ".join(my_hosts))
+            hosts = ", ".join(stringc(host, C.COLOR_HIGHLIGHT) for host in play.hosts)
+            self.display(f"💻 Hosts: {hosts}")
 
         self._current_play = play
         name = play.get_name().strip()
@@ -373,22 +447,28 @@ class CallbackModule(CallbackBase):
     def v2_runner_retry(self, result: "TaskResult"):
         """Displays the steps Ansible is retrying on a host."""
         msg = "  ️%s Retrying... (%d of %d)" % (
-            symbol("retry"),
+            SYMBOL_RETRY,
             result._result["attempts"],
             result._result["retries"],
         )
         if self._is_run_verbose(result, 2):
-            # All result keys stating with _ansible_ are internal, so remove them from the result before we output anything.
-            abridged_result = strip_internal_keys(
-                module_response_deepcopy(result._result)
+            if self._is_run_verbose(verbosity=3):
+                hidden_keys = ("exception",)
+            else:
+                hidden_keys = ("exception", "invocation", "diff")
+
+            # All result keys stating with _ansible_ are internal, so remove them
+            # from the result before we output anything. Only the top level is
+            # filtered, which spares a deep copy of the whole module result.
+            abridged_result = {
+                key: value
+                for key, value in result._result.items()
+                if not key.startswith("_ansible_") and key not in hidden_keys
+            }
+
+            msg += "Result was: %s" % CallbackModule.dump_value(
+                compact_json(abridged_result)
             )
-            abridged_result.pop("exception", None)
-
-            if not self._is_run_verbose(verbosity=3):
-                abridged_result.pop("invocation", None)
-                abridged_result.pop("diff", None)
-
-            msg += "Result was: %s" % CallbackModule.dump_value(abridged_result)
         self.display(msg, color=C.COLOR_DEBUG)
 
     def v2_runner_on_start(self, host, task: "Task"):
@@ -407,7 +487,7 @@ class CallbackModule(CallbackBase):
         self._preprocess_result(result)
         msg, display_color = CallbackModule.changed_artifacts(result, "ok", C.COLOR_OK)
         task_result = self._process_result_output(
-            result, msg, symbol("success"), display_color=display_color
+            result, msg, SYMBOL_SUCCESS, display_color=display_color
         )
         if task_result:
             self.display(task_result, display_color)
@@ -417,7 +497,7 @@ class CallbackModule(CallbackBase):
         if C.DISPLAY_SKIPPED_HOSTS:
             self._preprocess_result(result)
             task_result = self._process_result_output(
-                result, "skipped", symbol("skip"), display_color=C.COLOR_SKIP
+                result, "skipped", SYMBOL_SKIP, display_color=C.COLOR_SKIP
             )
             if task_result:
                 self.display(task_result, C.COLOR_SKIP)
@@ -435,7 +515,7 @@ class CallbackModule(CallbackBase):
         status = "ignored" if ignore_errors else "failed"
         color = C.COLOR_SKIP if ignore_errors else C.COLOR_ERROR
         task_result = self._process_result_output(
-            result, status, symbol("failure"), display_color=color
+            result, status, SYMBOL_FAILURE, display_color=color
         )
         if task_result:
             self.display(task_result, color)
@@ -446,7 +526,7 @@ class CallbackModule(CallbackBase):
         """
         self._flush_display_buffer()
         task_result = self._process_result_output(
-            result, "unreachable", symbol("dead"), display_color=C.COLOR_UNREACHABLE
+            result, "unreachable", SYMBOL_DEAD, display_color=C.COLOR_UNREACHABLE
         )
         if task_result:
             self.display(task_result, C.COLOR_UNREACHABLE)
@@ -460,7 +540,7 @@ class CallbackModule(CallbackBase):
         task_result = self._process_item_result_output(
             result,
             status,
-            symbol("success"),
+            SYMBOL_SUCCESS,
             display_color=display_color,
         )
         if task_result:
@@ -475,7 +555,7 @@ class CallbackModule(CallbackBase):
 
         self._preprocess_result(result)
         task_result = self._process_item_result_output(
-            result, "skipped", symbol("skip"), display_color=C.COLOR_SKIP
+            result, "skipped", SYMBOL_SKIP, display_color=C.COLOR_SKIP
         )
         if task_result:
             self.display(task_result, C.COLOR_SKIP)
@@ -484,7 +564,7 @@ class CallbackModule(CallbackBase):
         """When a task fails, this displays information about the failure."""
         self._flush_display_buffer()
         task_result = self._process_item_result_output(
-            result, "failed", symbol("failure"), display_color=C.COLOR_ERROR
+            result, "failed", SYMBOL_FAILURE, display_color=C.COLOR_ERROR
         )
         if task_result:
             self.display(task_result, C.COLOR_ERROR)
@@ -494,53 +574,52 @@ class CallbackModule(CallbackBase):
 
         It also displays an aggregate total for all executions.
         """
-        self.display(to_text("{0}\n\n").format(DIVIDER * TERMINAL_WIDTH))
-        totals = {
-            "ok": 0,
-            "changed": 0,
-            "unreachable": 0,
-            "failures": 0,
-            "rescued": 0,
-            "ignored": 0,
-        }
-
-        self._display_summary_table_row(
-            ("Hosts", C.COLOR_VERBOSE, 30),
-            ("Success", C.COLOR_VERBOSE, 7),
-            ("Changed", C.COLOR_VERBOSE, 7),
-            ("Unreachable", C.COLOR_VERBOSE, 11),
-            ("Failed", C.COLOR_VERBOSE, 6),
-            ("Rescued", C.COLOR_VERBOSE, 7),
-            ("Ignored", C.COLOR_VERBOSE, 7),
-        )
-        self._display_summary_table_separator("━")
+        totals = Counter()
+
+        # The whole table is built first and displayed at once
+        rows = [
+            f"{DIVIDER_LINE}\n",
+            self._summary_table_row(
+                ("Hosts", C.COLOR_VERBOSE, 30),
+                ("Success", C.COLOR_VERBOSE, 7),
+                ("Changed", C.COLOR_VERBOSE, 7),
+                ("Unreachable", C.COLOR_VERBOSE, 11),
+                ("Failed", C.COLOR_VERBOSE, 6),
+                ("Rescued", C.COLOR_VERBOSE, 7),
+                ("Ignored", C.COLOR_VERBOSE, 7),
+            ),
+            self._summary_table_separator("━"),
+        ]
 
         hosts = sorted(stats.processed.keys())
-        host_summary = None
         for host_name in hosts:
             host_summary = stats.summarize(host_name)
-            dictsum(totals, host_summary)
-            self._display_summary_table_row(
-                (host_name, C.COLOR_HIGHLIGHT, 30),
-                (host_summary["ok"], C.COLOR_OK, 7),
-                (host_summary["changed"], C.COLOR_CHANGED, 7),
-                (host_summary["unreachable"] or 0, C.COLOR_UNREACHABLE, 11),
-                (host_summary["failures"] or 0, C.COLOR_ERROR, 6),
-                (host_summary["rescued"], C.COLOR_OK, 7),
-                (host_summary["ignored"] or 0, C.COLOR_WARN, 7),
-                #                (host_summary["ignored"], C.COLOR_WARN, 7),
+            totals.update(host_summary)
+            rows.append(
+                self._summary_table_row(
+                    (host_name, C.COLOR_HIGHLIGHT, 30),
+                    (host_summary["ok"], C.COLOR_OK, 7),
+                    (host_summary["changed"], C.COLOR_CHANGED, 7),
+                    (host_summary["unreachable"] or 0, C.COLOR_UNREACHABLE, 11),
+                    (host_summary["failures"] or 0, C.COLOR_ERROR, 6),
+                    (host_summary["rescued"], C.COLOR_OK, 7),
+                    (host_summary["ignored"] or 0, C.COLOR_WARN, 7),
+                )
             )
 
-        self._display_summary_table_separator(DIVIDER)
-        self._display_summary_table_row(
-            ("Totals", C.COLOR_VERBOSE, 30),
-            (totals["ok"], C.COLOR_OK, 7),
-            (totals["changed"], C.COLOR_CHANGED, 7),
-            (totals["unreachable"] or 0, C.COLOR_UNREACHABLE, 11),
-            (totals["failures"] or 0, C.COLOR_ERROR, 6),
-            (totals["rescued"], C.COLOR_OK, 7),
-            (host_summary["ignored"] or 0, C.COLOR_WARN, 7),
+        rows.append(self._summary_table_separator(DIVIDER))
+        rows.append(
+            self._summary_table_row(
+                ("Totals", C.COLOR_VERBOSE, 30),
+                (totals["ok"], C.COLOR_OK, 7),
+                (totals["changed"], C.COLOR_CHANGED, 7),
+                (totals["unreachable"] or 0, C.COLOR_UNREACHABLE, 11),
+                (totals["failures"] or 0, C.COLOR_ERROR, 6),
+                (totals["rescued"], C.COLOR_OK, 7),
+                (totals["ignored"] or 0, C.COLOR_WARN, 7),
+            )
         )
+        self.display("\n".join(rows))
 
     def _handle_exception(self, result: dict["TaskResult"], use_stderr: bool = False):
         """When an exception happens during a playbook, this
@@ -568,40 +647,30 @@ class CallbackModule(CallbackBase):
 
         Returns True if the display verbosity >= `verbosity`, False otherwise.
         """
-        result = {} if not result else result._result
+        result = _empty_result if result is None else result._result
         return (
             self._display.verbosity >= verbosity or "_ansible_verbose_always" in result
         ) and "_ansible_verbose_override" not in result
 
     def _display_cli_arguments(self, indent: int = 2):
         """Display all arguments passed to Ansible in the command line."""
+        pad = " " * indent
+        item_pad = " " * (indent + 2)
         if context.CLIARGS.get("args"):
             self.display(
-                to_text("{0}Positional arguments: {1}").format(
-                    " " * indent, ", ".join(context.CLIARGS["args"])
-                ),
+                f"{pad}Positional arguments: {', '.join(context.CLIARGS['args'])}",
                 color=C.COLOR_VERBOSE,
             )
 
-        for arg, val in {
-            key: value
-            for key, value in context.CLIARGS.items()
-            if key != "args" and value
-        }.items():
+        for arg, val in context.CLIARGS.items():
+            if arg == "args" or not val:
+                continue
             if iscollection(val):
-                self.display(
-                    to_text("{0}{1}:").format(" " * indent, arg), color=C.COLOR_VERBOSE
-                )
+                self.display(f"{pad}{arg}:", color=C.COLOR_VERBOSE)
                 for v in val:
-                    self.display(
-                        to_text("{0}- {1}").format(" " * (indent + 2), v),
-                        color=C.COLOR_VERBOSE,
-                    )
+                    self.display(f"{item_pad}- {v}", color=C.COLOR_VERBOSE)
             else:
-                self.display(
-                    to_text("{0}{1}: {2}").format(" " * indent, arg, val),
-                    color=C.COLOR_VERBOSE,
-                )
+                self.display(f"{pad}{arg}: {val}", color=C.COLOR_VERBOSE)
 
     def _get_tags(self, playbook):
         """Returns a collection of tags that will be associated with all tasks
@@ -617,34 +686,51 @@ class CallbackModule(CallbackBase):
         Returns:
             A sorted list of all tags used in this run.
         """
-        tags = set()
-        T = []
-        for play in playbook.get_plays():
-            for block in play.compile():
-                blocks = block.filter_tagged_tasks({})
-                if blocks.has_tasks():
-                    for task in blocks.block:
-                        tags.update(task.tags)
-                        T.append(task.tags)
-
         if "tags" in context.CLIARGS:
             requested_tags = set(context.CLIARGS["tags"])
         else:
             requested_tags = {"all"}
+
+        # Neither the playbook nor the CLI tags change during a run
+        cache_key = (id(playbook), tuple(sorted(requested_tags)))
+        if cache_key in self._tags_cache:
+            return self._tags_cache[cache_key]
+
+        tasks = (
+            task
+            for play in playbook.get_plays()
+            for block in play.compile()
+            for task in block.filter_tagged_tasks({}).block
+        )
+        tags = set(itertools.chain.from_iterable(task.tags for task in tasks))
+
         if len(requested_tags) > 1 or next(iter(requested_tags)) != "all":
             tags = tags.intersection(requested_tags)
-        return sorted(tags)
+        self._tags_cache[cache_key] = sorted(tags)
+        return self._tags_cache[cache_key]
 
     def _display_tag_strip(self, playbook: object, width: int = TERMINAL_WIDTH):
         """Displays the tags given in command that are also present in `playbook`
 
         If the line is longer than `width` characters, the line will wrap.
         """
-        tags = self._get_tags(playbook)
-        formatted_tags = []
-        for tag in tags:
-            formatted_tags.append(stringc(tag, C.COLOR_HIGHLIGHT))
-        self.display(f"🏴 Tags: {', '.join(formatted_tags)}")
+        title = "🏴 Tags: "
+        # The flag is two columns wide on screen, hence the extra column
+        indent = " " * (len(title) + 1)
+        line_len = len(indent)
+        parts = [title]
+        for tag in self._get_tags(playbook):
+            if len(parts) > 1:
+                # Keep one column free for the comma left behind by a break
+                if line_len + 2 + len(tag) + 1 > width:
+                    parts.append(f",\n{indent}")
+                    line_len = len(indent)
+                else:
+                    parts.append(", ")
+                    line_len += 2
+            parts.append(stringc(tag, C.COLOR_HIGHLIGHT))
+            line_len += len(tag)
+        self.display("".join(parts))
 
     def _get_task_display_name(self, task: "Task"):
         """Caches the given `task` name if it is not an included task."""
@@ -677,7 +763,7 @@ class CallbackModule(CallbackBase):
         task_host = f"{prefix}{task_host}"
         if self.delegated_vars:
             task_host += to_text(" {0} {1}{2}").format(
-                symbol("arrow_right"), prefix, self.delegated_vars["ansible_host"]
+                SYMBOL_ARROW_RIGHT, prefix, self.delegated_vars["ansible_host"]
             )
         return task_host
 
@@ -714,37 +800,47 @@ class CallbackModule(CallbackBase):
             # The title didn't display, so there's no status to update
             return ""
 
-        task_result = ""
+        parts = []
         task_host = self._get_host_string(result)
+        result_dict = result._result
+
+        # Same checks as `_is_run_verbose`, evaluated once for all sessions
+        verbosity_max = self._display.verbosity
+        always_verbose = "_ansible_verbose_always" in result_dict
+        never_verbose = "_ansible_verbose_override" in result_dict
 
         if not self._item_processed:
-            task_result = to_text("{0}{1}{2}").format(
-                task_host,
-                status.upper(),
-                f"\r {symbol_char} \n" if symbol_char else "",
-            )
+            parts.append(f"{task_host}{status.upper()}")
+            if symbol_char:
+                parts.append(f"\r {symbol_char} \n")
 
-        for key, verbosity in _session_order.items():
+        for key, verbosity in _session_order:
             if (
-                key in result._result
-                and result._result[key]
-                and self._is_run_verbose(result, verbosity)
+                result_dict.get(key)
+                and (verbosity_max >= verbosity or always_verbose)
+                and not never_verbose
             ) or (status == "failed" and key == "msg"):
-                task_result += self.reindent_session(
-                    _session_title.get(key, key),
-                    result._result[key],
-                    color=display_color,
+                parts.append(
+                    self.reindent_session(
+                        _session_title.get(key, key),
+                        result_dict[key],
+                        color=display_color,
+                    )
                 )
 
-        for title, text in result._result.items():
-            if title not in _session_title and text and self._is_run_verbose(result, 3):
-                task_result += "\n" + self.reindent_session(
-                    title.replace("_", " ").replace(".", " ").capitalize(),
-                    text,
-                    color=display_color,
-                )
+        if (verbosity_max >= 3 or always_verbose) and not never_verbose:
+            for title, text in result_dict.items():
+                if title not in _session_title and text:
+                    parts.append("\n")
+                    parts.append(
+                        self.reindent_session(
+                            prettify_title(title),
+                            text,
+                            color=display_color,
+                        )
+                    )
 
-        return task_result
+        return "".join(parts)
 
     def _process_item_result_output(
         self,
@@ -782,9 +878,7 @@ class CallbackModule(CallbackBase):
                 item_name = item_name.get("path")
             else:
                 item_name = 'JSON: "{0}"'.format(
-                    stringtruncate(
-                        json.dumps(item_name, separators=(",", ":")), width=36
-                    )
+                    stringtruncate(compact_json(item_name), width=36)
                 )
 
         # prep output vars
@@ -798,28 +892,41 @@ class CallbackModule(CallbackBase):
                 _session_title["stderr"], result._result["msg"], color=display_color
             )
 
-        return f" {symbol_char} {f'{self.my_role} ' or ''}{self.task_display_name}: {item_name}{host}... {stringc(status.upper(), display_color)}{error_info}"
+        role_prefix = f"{self.my_role} " if self.my_role else ""
+        return "".join(
+            (
+                " ",
+                symbol_char,
+                " ",
+                role_prefix,
+                self.task_display_name,
+                ": ",
+                str(item_name),
+                host,
+                "... ",
+                stringc(status.upper(), display_color),
+                error_info,
+            )
+        )
 
-    def _display_summary_table_separator(self, symbol_char):
-        """Displays a line separating header or footer from content on the
+    def _summary_table_separator(self, symbol_char) -> str:
+        """Returns a line separating header or footer from content on the
         summary table.
 
         Args:
             symbol_char: An UTF-8 character to be used as a table separator
         """
-        self.display(
-            to_text(" {0} {1} {2} {3} {4} {5} {6}").format(
-                symbol_char * 30,
-                symbol_char * 7,
-                symbol_char * 7,
-                symbol_char * 11,
-                symbol_char * 6,
-                symbol_char * 7,
-                symbol_char * 7,
-            )
+        return self._SUMMARY_ROW_FORMAT.format(
+            symbol_char * 30,
+            symbol_char * 7,
+            symbol_char * 7,
+            symbol_char * 11,
+            symbol_char * 6,
+            symbol_char * 7,
+            symbol_char * 7,
         )
 
-    def _display_summary_table_row(
+    def _summary_table_row(
         self,
         host: tuple[str, str, int],
         success: tuple[str, str, int],
@@ -828,8 +935,8 @@ class CallbackModule(CallbackBase):
         failed: tuple[str, str, int],
         rescued: tuple[str, str, int],
         ignored: tuple[str, str, int],
-    ):
-        """Displays a single line in the summary table, respecting the color and
+    ) -> str:
+        """Returns a single line of the summary table, respecting the color and
         size given in the arguments.
 
         Each argument in this method is a tuple of three values:
@@ -848,66 +955,57 @@ class CallbackModule(CallbackBase):
                 completed successfully.
             ignored: How many tasks were ignored.
         """
-        self.display(
-            to_text(" {0} {1} {2} {3} {4} {5} {6}").format(
-                stringtruncate(host[0], host[1], host[2]),
-                stringtruncate(success[0], success[1], success[2]),
-                stringtruncate(changed[0], changed[1], changed[2]),
-                stringtruncate(dark[0], dark[1], dark[2]),
-                stringtruncate(failed[0], failed[1], failed[2]),
-                stringtruncate(rescued[0], rescued[1], rescued[2]),
-                stringtruncate(ignored[0], ignored[1], ignored[2]),
-            )
+        columns = (host, success, changed, dark, failed, rescued, ignored)
+        return self._SUMMARY_ROW_FORMAT.format(
+            *(stringtruncate(text, color, width) for text, color, width in columns)
         )
 
-    def _display_task_decision_score(self, task: "Task") -> float:
-        """Calculate the probability for the given `task` to be displayed
-        based on configurations and the task `when` clause.
-
-        Returns a number between 0 and 1 representing the probability to show
-            the given `task`. Currently this method only return 3 possible
-            values:
+    def _display_task_decision_score(self, task: "Task") -> TaskDisplayDecision:
+        """Decide whether the given `task` should be displayed based on
+        configurations and the task `when` clause.
 
-            Examples of return values:
-            - 0.1: We are sure that the task should not be displayed
-            - 0.5: We don't know if this task should be displayed or not. By
-                default, we associate any `task` with this score, and change
-                it as needed
-            - 1.0: We are sure the `task` should be displayed.
+        Returns a `TaskDisplayDecision`:
+            - SKIP: We are sure that the task should not be displayed
+            - UNKNOWN: We don't know if this task should be displayed or not.
+                By default, we associate any `task` with this decision, and
+                change it as needed
+            - SHOW: We are sure the `task` should be displayed.
         """
-        score = 0.5
-        var_manager = task.get_variable_manager()
+        # Cheap checks first, so the per host evaluation below only runs
+        # when nothing else can decide
+        if not task.name and task.action != "debug":
+            return TaskDisplayDecision.SKIP
+
         task_args = task.args
-        if task.when and var_manager:
-            all_hosts = CallbackModule.get_chained_value(
-                var_manager.get_vars(), "hostvars"
-            )
-            play_task_vars = var_manager.get_vars(
-                play=self._current_play, host=self._current_host, task=task
-            )
-            templar = Templar(task._loader, variables=play_task_vars)
-            exception = False
-            for hostname in all_hosts.keys():
-                host_vars = CallbackModule.get_chained_value(all_hosts, hostname)
-                host_vars.update(play_task_vars)
-                try:
-                    if not task.evaluate_conditional(templar, host_vars):
-                        score = 0.0
-                        break
-                except Exception:
-                    exception = True
-            else:
-                if not exception:
-                    score = 1.0
-        elif task.action == "debug" and task_args and "verbosity" in task_args:
-            score = (
-                1.0
-                if self._is_run_verbose(verbosity=int(task_args["verbosity"]))
-                else 0.0
-            )
+        if task.action == "debug" and task_args and "verbosity" in task_args:
+            if not self._is_run_verbose(verbosity=int(task_args["verbosity"])):
+                return TaskDisplayDecision.SKIP
+            if not task.when:
+                return TaskDisplayDecision.SHOW
 
-        if not task.name and task.action != "debug":
-            score = 0.0
+        var_manager = task.get_variable_manager()
+        if not task.when or not var_manager:
+            return TaskDisplayDecision.UNKNOWN
+
+        score = TaskDisplayDecision.SHOW
+        all_hosts = CallbackModule.get_chained_value(var_manager.get_vars(), "hostvars")
+        play_task_vars = var_manager.get_vars(
+            play=self._current_play, host=self._current_host, task=task
+        )
+        templar = Templar(task._loader, variables=play_task_vars)
+        for host_vars in all_hosts.values():
+            if not isinstance(host_vars, Mapping):
+                continue
+            # Layered rather than merged, play and task vars still take precedence
+            merged_vars = ChainMap(play_task_vars, host_vars)
+            try:
+                if not task.evaluate_conditional(templar, merged_vars):
+                    score = TaskDisplayDecision.SKIP
+                    break
+            except Exception:
+                # The remaining hosts cannot make the outcome any more certain
+                score = TaskDisplayDecision.UNKNOWN
+                break
 
         return score
 
@@ -919,26 +1017,28 @@ class CallbackModule(CallbackBase):
         if not self.task_display_name:
             return
 
-        temp_name = self.task_display_name
-
+        role_prefix = ""
+        self.my_role = ""
         if task._role:
             my_role = task._role.get_name() or ""
-            formatted_role = stringc(f"{my_role} |", "dark gray")
+            formatted_role = self._role_prefix_cache.get(my_role)
+            if formatted_role is None:
+                formatted_role = stringc(f"{my_role} |", "dark gray")
+                self._role_prefix_cache[my_role] = formatted_role
             self.my_role = formatted_role
-            temp_name = f"{formatted_role} {temp_name}"
+            role_prefix = f"{formatted_role} "
 
-        if is_handler:
-            temp_name = f"{temp_name} (via handler)"
+        handler_suffix = " (via handler)" if is_handler else ""
 
         # Add symbol and dots
-        temp_name = f" {symbol('empty')} {temp_name}... "
-
-        self._task_name_buffer = temp_name
+        self._task_name_buffer = (
+            f" {SYMBOL_EMPTY} {role_prefix}{self.task_display_name}{handler_suffix}... "
+        )
 
-        display_score = self._display_task_decision_score(task)
-        if display_score >= 1.0 or C.DISPLAY_SKIPPED_HOSTS:
+        decision = self._display_task_decision_score(task)
+        if decision == TaskDisplayDecision.SHOW or C.DISPLAY_SKIPPED_HOSTS:
             self._flush_display_buffer()
-        elif display_score < 0.1:
+        elif decision == TaskDisplayDecision.SKIP:
             self._task_name_buffer = None
 
     def _flush_display_buffer(self):
@@ -959,26 +1059,39 @@ class CallbackModule(CallbackBase):
             not a JSON or YAML content, `None` will be returned.
         """
         textobj = None
-
-        try:
-            textobj = json.loads(text)
-        except Exception as e:
+        if isinstance(text, str):
+            # The C parsers only accept exact `str`, not subclasses such as
+            # Ansible's unsafe text, whose `__str__` returns itself
+            text = str.__str__(text)
+
+        # Only attempt JSON when `text` can actually start a JSON document,
+        # YAML document markers ("---") never do
+        if text[:1] in JSON_START_CHARS and text[:2] != "--":
             try:
-                textobj = yaml.load(text, Loader=yaml.SafeLoader)
+                return json_loads(text)
             except Exception:
                 pass
 
+        try:
+            textobj = yaml.load(text, Loader=YamlSafeLoader)
+        except Exception:
+            pass
+
         return textobj
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def dump_value(value: str) -> str:
         """Given a string, this method will parse the given string and return
         the parsed object converted to a YAML representation.
+
+        The same outputs tend to repeat across tasks and hosts, so a bounded
+        number of results is cached.
         """
         text = None
         obj = CallbackModule.try_parse_string(value)
         if obj:
-            text = yaml.dump(obj, Dumper=yaml.SafeDumper, default_flow_style=False)
+            text = yaml.dump(obj, Dumper=YamlSafeDumper, default_flow_style=False)
         return text
 
     def reindent_session(
@@ -987,31 +1100,33 @@ class CallbackModule(CallbackBase):
         """This method returns a text formatted with the given `indent` and
         wrapped at the given `width`.
         """
-        textwidth = width - len(title)
         textstr = str(text).strip()
-        dumped = False
-        if textstr.startswith("---") or textstr.startswith("{"):
+        dumped = None
+        if textstr.startswith(STRUCTURED_TEXT_PREFIXES):
             dumped = CallbackModule.dump_value(textstr)
-            textstr = dumped if dumped else textstr
+            if dumped:
+                textstr = dumped
         lines = textstr.splitlines()
 
+        prefix = f"   {self.my_role} "
         formatted_title = stringc(f"{title}:", color) if color else title
-        output = f"   {self.my_role} {formatted_title}\n"
+        parts = [prefix, formatted_title, "\n"]
+        colorize = functools.partial(stringc, color=color) if color else str
+
+        # Fit on the visible width of the prefix, not on its color escapes
+        visible_prefix = ansi_escape.sub("", prefix) if "\x1b" in prefix else prefix
+        textwidth = width - len(visible_prefix)
 
         if (len(lines) == 1) and (len(textstr) <= textwidth) and (not dumped):
-            formatted_line = stringc(textstr, color) if color else textstr
-            output += f"   {self.my_role} {formatted_line}\n"
-            return output
+            parts.extend((prefix, colorize(textstr), "\n"))
+            return "".join(parts)
 
+        wrapper = textwrap.TextWrapper(width=textwidth)
         for line in lines:
-            formatted_line = textwrap.fill(text=line, width=width - len(self.my_role))
-            formatted_line = stringc(formatted_line, color) if color else formatted_line
-            formatted_lines = f"   {self.my_role} {formatted_line}".split("\n")
-            if len(formatted_lines) > 1:
-                output += f"\n   {self.my_role} ".join(formatted_lines)
-            else:
-                output += f"{formatted_lines[0]}\n"
-        return output
+            # Blank lines wrap to nothing, but are kept in the output
+            for wrapped_line in wrapper.wrap(line) or [""]:
+                parts.extend((prefix, colorize(wrapped_line), "\n"))
+        return "".join(parts)
 
     @staticmethod
     def changed_artifacts(
@@ -1047,18 +1162,13 @@ class CallbackModule(CallbackBase):
             ... }
             >>> CallbackModule.get_chained_value(nested_dict, "dict_key", "other_dict_key", "target_value")
             'Found It!'
+
+        Mappings are returned as they are, not copied, so callers must not
+        modify them.
         """
-        if args:
-            key = args[0]
-            others = args[1:]
-
-            if key in mapping:
-                value = mapping[key]
-                if others:
-                    return CallbackModule.get_chained_value(value, *others)
-                if isinstance(value, Mapping):
-                    dict_value = {}
-                    dict_value.update(value)
-                    return dict_value
-                return value
-        return None
+        value = mapping
+        for key in args:
+            if not isinstance(value, Mapping) or key not in value:
+                return None
+            value = value[key]
+        return value